@@ -1,12 +1,17 @@
+import functools
+
 from phi.agent import Agent
-from phi.model.groq import Groq
-from dotenv import load_dotenv
 
-load_dotenv()
+from config import get_settings
+from llm_cache import CachedGroq
+
 
-agent = Agent(
-    model=Groq(id="llama-3.3-70b-versatile")
-)
+@functools.cache
+def build_agent() -> Agent:
+    return Agent(
+        model=CachedGroq(id=get_settings().groq_model, temperature=0)
+    )
 
 
-agent.print_response("Share a 2 sentence love story between dosa and samosa")
\ No newline at end of file
+if __name__ == "__main__":
+    build_agent().print_response("Share a 2 sentence love story between dosa and samosa")
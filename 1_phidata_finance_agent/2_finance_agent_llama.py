@@ -1,11 +1,31 @@
 """Run `pip install yfinance` to install dependencies."""
 
+import functools
+
 from phi.agent import Agent
-from phi.model.groq import Groq
-from phi.tools.yfinance import YFinanceTools
-from dotenv import load_dotenv
 
-load_dotenv()
+from config import get_settings
+from finance_tools import CachedYFinanceTools
+from llm_cache import CachedGroq
+
+
+_SYMBOLS = {
+    k.lower(): v
+    for k, v in {
+        "Phidata": "MSFT",
+        "Infosys": "INFY",
+        "Tesla": "TSLA",
+        "Apple": "AAPL",
+        "Microsoft": "MSFT",
+        "Amazon": "AMZN",
+        "Google": "GOOGL",
+    }.items()
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _lookup_symbol(company: str) -> str:
+    return _SYMBOLS.get(company, "Unknown")
 
 
 def get_company_symbol(company: str) -> str:
@@ -17,30 +37,28 @@ def get_company_symbol(company: str) -> str:
     Returns:
         str: The symbol for the company.
     """
-    symbols = {
-        "Phidata": "MSFT",
-        "Infosys": "INFY",
-        "Tesla": "TSLA",
-        "Apple": "AAPL",
-        "Microsoft": "MSFT",
-        "Amazon": "AMZN",
-        "Google": "GOOGL",
-    }
-    return symbols.get(company, "Unknown")
-
-
-agent = Agent(
-    model=Groq(id="llama-3.3-70b-versatile"),
-    tools=[YFinanceTools(stock_price=True, analyst_recommendations=True, stock_fundamentals=True), get_company_symbol],
-    instructions=[
-        "Use tables to display data.",
-        "If you need to find the symbol for a company, use the get_company_symbol tool.",
-    ],
-    show_tool_calls=True,
-    markdown=True,
-    debug_mode=True,
-)
-
-agent.print_response(
-    "Summarize and compare analyst recommendations and fundamentals for TSLA and MSFT. Show in tables.", stream=True
-)
\ No newline at end of file
+    # Keep the registered tool a plain function: phi's Function.from_callable
+    # (via pydantic's validate_call) rejects lru_cache wrapper objects and
+    # would silently drop the tool.
+    return _lookup_symbol(company.strip().lower())
+
+
+@functools.cache
+def build_agent() -> Agent:
+    return Agent(
+        model=CachedGroq(id=get_settings().groq_model, temperature=0),
+        tools=[CachedYFinanceTools(stock_price=True, analyst_recommendations=True, stock_fundamentals=True), get_company_symbol],
+        instructions=[
+            "Use tables to display data.",
+            "If you need to find the symbol for a company, use the get_company_symbol tool.",
+        ],
+        show_tool_calls=True,
+        markdown=True,
+        debug_mode=True,
+    )
+
+
+if __name__ == "__main__":
+    build_agent().print_response(
+        "Summarize and compare analyst recommendations and fundamentals for TSLA and MSFT. Show in tables.", stream=True
+    )
\ No newline at end of file
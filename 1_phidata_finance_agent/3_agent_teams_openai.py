@@ -1,40 +1,78 @@
+import functools
+import hashlib
+import json
+import time
+
 from phi.agent import Agent
-from phi.model.openai import OpenAIChat
-from phi.model.groq import Groq
 from phi.tools.duckduckgo import DuckDuckGo
-from phi.tools.yfinance import YFinanceTools
-from dotenv import load_dotenv
-
-load_dotenv()
-
-web_agent = Agent(
-    name="Web Agent",
-    # model=Groq(id="llama-3.3-70b-versatile"),
-    model=OpenAIChat(id="gpt-4o"),
-    tools=[DuckDuckGo()],
-    instructions=["Always include sources"],
-    show_tool_calls=True,
-    markdown=True
-)
-
-finance_agent = Agent(
-    name="Finance Agent",
-    role="Get financial data",
-    # model=Groq(id="llama-3.3-70b-versatile"),
-    model=OpenAIChat(id="gpt-4o"),
-    tools=[YFinanceTools(stock_price=True, analyst_recommendations=True, company_info=True)],
-    instructions=["Use tables to display data"],
-    show_tool_calls=True,
-    markdown=True,
-)
-
-agent_team = Agent(
-    # model=Groq(id="llama-3.3-70b-versatile"),
-    model=OpenAIChat(id="gpt-4o"),
-    team=[web_agent, finance_agent],
-    instructions=["Always include sources", "Use tables to display data"],
-    show_tool_calls=True,
-    markdown=True,
-)
-
-agent_team.print_response("Summarize analyst recommendations and share the latest news for NVDA", stream=True)
+
+from config import get_settings
+from finance_tools import CachedYFinanceTools
+from llm_cache import CachedOpenAIChat, FileCacheBackend
+
+# News goes stale fast; keep whole-team answers for 15 minutes.
+TEAM_CACHE_TTL = 900
+
+_team_cache = FileCacheBackend()
+
+@functools.cache
+def build_agent_team() -> Agent:
+    web_agent = Agent(
+        name="Web Agent",
+        # model=Groq(id="llama-3.3-70b-versatile"),
+        model=CachedOpenAIChat(id=get_settings().openai_model, temperature=0),
+        tools=[DuckDuckGo()],
+        instructions=["Always include sources"],
+        show_tool_calls=True,
+        markdown=True
+    )
+
+    finance_agent = Agent(
+        name="Finance Agent",
+        role="Get financial data",
+        # model=Groq(id="llama-3.3-70b-versatile"),
+        model=CachedOpenAIChat(id=get_settings().openai_model, temperature=0),
+        tools=[CachedYFinanceTools(stock_price=True, analyst_recommendations=True, company_info=True)],
+        instructions=["Use tables to display data"],
+        show_tool_calls=True,
+        markdown=True,
+    )
+
+    return Agent(
+        # model=Groq(id="llama-3.3-70b-versatile"),
+        model=CachedOpenAIChat(id=get_settings().openai_model, temperature=0),
+        team=[web_agent, finance_agent],
+        instructions=["Always include sources", "Use tables to display data"],
+        show_tool_calls=True,
+        markdown=True,
+    )
+
+
+def cached_team_run(prompt: str, ttl: int = TEAM_CACHE_TTL, bypass_cache: bool = False) -> str:
+    """Run the team, replaying the final answer from cache when the same
+    prompt (against the same team configuration) was answered within `ttl`
+    seconds — a hit skips the entire chain of supervisor and sub-agent
+    LLM calls, not just one completion."""
+    agent_team = build_agent_team()
+    config = {
+        "agents": [(a.name, a.model.id) for a in agent_team.team],
+        "model": agent_team.model.id,
+        "instructions": agent_team.instructions,
+        "prompt": " ".join(prompt.split()).lower(),
+    }
+    key = hashlib.sha256(
+        json.dumps(config, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+    if not bypass_cache:
+        entry = _team_cache.get(key)
+        if entry is not None and time.time() - entry["ts"] < ttl:
+            return entry["content"]
+
+    response = agent_team.run(prompt)
+    _team_cache.set(key, {"ts": time.time(), "content": response.content})
+    return response.content
+
+
+if __name__ == "__main__":
+    print(cached_team_run("Summarize analyst recommendations and share the latest news for NVDA"))
@@ -0,0 +1,36 @@
+"""Shared environment configuration for the phidata scripts.
+
+The .env file is parsed once per process; every script reads model ids
+and keys from the cached Settings snapshot instead of re-running
+load_dotenv() and os.getenv() at its own import time.
+"""
+
+import functools
+import os
+import warnings
+from dataclasses import dataclass
+
+from dotenv import load_dotenv
+
+
+@dataclass(frozen=True)
+class Settings:
+    groq_api_key: str
+    groq_model: str
+    openai_api_key: str
+    openai_model: str
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    load_dotenv()
+    settings = Settings(
+        groq_api_key=os.getenv("GROQ_API_KEY", ""),
+        groq_model=os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile"),
+        openai_api_key=os.getenv("OPENAI_API_KEY", ""),
+        openai_model=os.getenv("OPENAI_MODEL", "gpt-4o"),
+    )
+    # lru_cache(1) means this fires at most once per process.
+    if not settings.groq_api_key and not settings.openai_api_key:
+        warnings.warn("Neither GROQ_API_KEY nor OPENAI_API_KEY is set; set one in .env")
+    return settings
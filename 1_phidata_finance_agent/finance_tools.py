@@ -0,0 +1,64 @@
+"""YFinanceTools with per-tool TTL caching.
+
+Yahoo data ages at very different rates, so each tool method gets its
+own freshness window: seconds for live prices, hours for analyst
+recommendations, a week for company profiles. Entries are persisted
+through the same file backend as the LLM cache so repeat CLI runs also
+hit warm data.
+"""
+
+import functools
+import time
+from typing import Callable
+
+from phi.tools.yfinance import YFinanceTools
+
+from llm_cache import FileCacheBackend
+
+TOOL_TTLS = {
+    "stock_price": 30,
+    "analyst_recommendations": 3600,
+    "stock_fundamentals": 3600,
+    "company_info": 604800,
+}
+
+_backend = FileCacheBackend()
+
+
+def ttl_cache(ttl: int) -> Callable:
+    """Cache a tool method's return value for `ttl` seconds, keyed on
+    (method name, arguments)."""
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            key = "-".join([func.__name__, *map(str, args), *map(str, kwargs.values())])
+            entry = _backend.get(key)
+            now = time.time()
+            if entry is not None and now - entry["ts"] < ttl:
+                return entry["value"]
+            value = func(self, *args, **kwargs)
+            _backend.set(key, {"ts": now, "value": value})
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+class CachedYFinanceTools(YFinanceTools):
+    @ttl_cache(ttl=TOOL_TTLS["stock_price"])
+    def get_current_stock_price(self, symbol: str) -> str:
+        return super().get_current_stock_price(symbol)
+
+    @ttl_cache(ttl=TOOL_TTLS["analyst_recommendations"])
+    def get_analyst_recommendations(self, symbol: str) -> str:
+        return super().get_analyst_recommendations(symbol)
+
+    @ttl_cache(ttl=TOOL_TTLS["stock_fundamentals"])
+    def get_stock_fundamentals(self, symbol: str) -> str:
+        return super().get_stock_fundamentals(symbol)
+
+    @ttl_cache(ttl=TOOL_TTLS["company_info"])
+    def get_company_info(self, symbol: str) -> str:
+        return super().get_company_info(symbol)
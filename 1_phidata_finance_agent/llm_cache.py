@@ -0,0 +1,124 @@
+"""On-disk response cache for the phidata model classes.
+
+Identical deterministic requests (temperature=0) are keyed by a SHA-256
+of the model id, the message list, and the attached tool names, so repeat
+runs during development skip the provider round-trip entirely.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import ClassVar, Iterator, List, Optional, Protocol
+
+from phi.model.groq import Groq
+from phi.model.message import Message
+from phi.model.openai import OpenAIChat
+from phi.model.response import ModelResponse
+
+CACHE_DIR = Path(__file__).parent / ".llm_cache"
+
+
+class CacheBackend(Protocol):
+    def get(self, key: str) -> Optional[dict]: ...
+
+    def set(self, key: str, value: dict) -> None: ...
+
+
+class FileCacheBackend:
+    """Sharded directory of JSON blobs, one file per cache entry."""
+
+    def __init__(self, cache_dir: Path = CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+
+    def _path_for(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[dict]:
+        try:
+            return json.loads(self._path_for(key).read_text())
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def set(self, key: str, value: dict) -> None:
+        path = self._path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(value))
+
+
+class LLMCache:
+    def __init__(self, backend: Optional[CacheBackend] = None):
+        self.backend: CacheBackend = backend or FileCacheBackend()
+        self.stats = {"hits": 0, "misses": 0, "chars_saved": 0}
+
+    def key_for(self, model_id: str, messages: List[dict], tool_names: List[str]) -> str:
+        payload = json.dumps(
+            {"model": model_id, "messages": messages, "tools": sorted(tool_names)},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        entry = self.backend.get(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        self.stats["chars_saved"] += len(entry.get("content") or "")
+        return entry
+
+    def set(self, key: str, value: dict) -> None:
+        self.backend.set(key, value)
+
+
+class _CachedModelMixin:
+    """Checks the cache before delegating a completion call to the provider.
+
+    Only deterministic requests (temperature=0) are safe to replay, so
+    anything else falls straight through to the provider.
+    """
+
+    cache: ClassVar[LLMCache] = LLMCache()
+
+    def _cache_key(self, messages: List[Message]) -> str:
+        tool_names = sorted(self.functions.keys()) if self.functions else []
+        message_dicts = [{"role": m.role, "content": m.content} for m in messages]
+        return self.cache.key_for(self.id, message_dicts, tool_names)
+
+    def response(self, messages: List[Message]) -> ModelResponse:
+        if self.temperature != 0:
+            return super().response(messages)
+        key = self._cache_key(messages)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return ModelResponse(content=cached["content"])
+        model_response = super().response(messages)
+        if model_response.content is not None:
+            self.cache.set(key, {"content": model_response.content})
+        return model_response
+
+    def response_stream(self, messages: List[Message]) -> Iterator[ModelResponse]:
+        if self.temperature != 0:
+            yield from super().response_stream(messages)
+            return
+        key = self._cache_key(messages)
+        cached = self.cache.get(key)
+        if cached is not None:
+            # Replay the whole cached response as a single chunk.
+            yield ModelResponse(content=cached["content"])
+            return
+        chunks = []
+        for model_response in super().response_stream(messages):
+            if model_response.content is not None:
+                chunks.append(model_response.content)
+            yield model_response
+        if chunks:
+            self.cache.set(key, {"content": "".join(chunks)})
+
+
+class CachedGroq(_CachedModelMixin, Groq):
+    pass
+
+
+class CachedOpenAIChat(_CachedModelMixin, OpenAIChat):
+    pass
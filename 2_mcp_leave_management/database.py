@@ -0,0 +1,332 @@
+"""SQLite persistence for the leave management MCP server.
+
+Connections are tuned for the server's concurrent tool invocations:
+WAL journal mode (set once on the DB file) lets readers proceed while a
+write is in flight, synchronous=NORMAL halves fsyncs, and a generous
+busy_timeout absorbs transient lock contention instead of surfacing
+SQLITE_BUSY to the tools.
+
+Schema creation runs synchronously once at startup; the accessors are
+async over aiosqlite so a blocking SQLite call never stalls the MCP
+event loop — multiple in-flight tool calls overlap across the reader
+pool instead of serializing behind one syscall.
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional, Tuple
+
+import aiosqlite
+
+DATABASE_NAME = "leave_management.db"
+SCHEMA_VERSION = 1
+
+_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-1048576",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA busy_timeout=30000",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def get_db_connection() -> sqlite3.Connection:
+    conn = sqlite3.connect(
+        DATABASE_NAME, timeout=30, isolation_level=None, check_same_thread=False
+    )
+    conn.row_factory = sqlite3.Row
+    for pragma in _PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+class AsyncConnectionPool:
+    """One serialized writer plus a bounded pool of read-only connections.
+
+    With WAL enabled the readers run in parallel with the writer, and the
+    single writer (taken with BEGIN IMMEDIATE) acquires the write lock up
+    front so concurrent tool calls queue instead of racing into
+    SQLITE_BUSY. Keeping connections open also amortizes the per-call
+    connect/close cost of the previous implementation.
+    """
+
+    def __init__(self) -> None:
+        self._writer: Optional[aiosqlite.Connection] = None
+        self._writer_lock = asyncio.Lock()
+        self._readers: asyncio.Queue = asyncio.Queue()
+
+    async def open(self, size: Optional[int] = None) -> None:
+        self._writer = await aiosqlite.connect(
+            DATABASE_NAME, timeout=30, isolation_level=None
+        )
+        for pragma in _PRAGMAS:
+            await self._writer.execute(pragma)
+        for _ in range(size or os.cpu_count() or 4):
+            self._readers.put_nowait(await self._open_reader())
+
+    async def _open_reader(self) -> aiosqlite.Connection:
+        conn = await aiosqlite.connect(f"file:{DATABASE_NAME}?mode=ro", uri=True, timeout=30)
+        # Default tuple rows: readers fetch narrow result sets by position,
+        # so skip the per-row sqlite3.Row wrapper.
+        await conn.execute("PRAGMA busy_timeout=30000")
+        return conn
+
+    async def close(self) -> None:
+        """Close all connections; aiosqlite threads are non-daemon, so
+        leaving them open keeps the process alive at shutdown."""
+        while not self._readers.empty():
+            await self._readers.get_nowait().close()
+        if self._writer is not None:
+            await self._writer.close()
+            self._writer = None
+
+    @asynccontextmanager
+    async def acquire_reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        conn = await self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put_nowait(conn)
+
+    @asynccontextmanager
+    async def writer(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Exclusive access to the writer connection without transaction
+        management, for callers that commit or roll back conditionally."""
+        async with self._writer_lock:
+            yield self._writer
+
+    @asynccontextmanager
+    async def write_txn(self) -> AsyncIterator[aiosqlite.Connection]:
+        async with self._writer_lock:
+            await self._writer.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._writer
+            except Exception:
+                await self._writer.execute("ROLLBACK")
+                raise
+            else:
+                await self._writer.execute("COMMIT")
+
+
+def create_tables_if_not_exist() -> None:
+    conn = get_db_connection()
+    # journal_mode persists on the DB file, so set it once here rather
+    # than on every connection.
+    conn.execute("PRAGMA journal_mode=WAL")
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS employees (
+            employee_id TEXT PRIMARY KEY COLLATE NOCASE,
+            balance INTEGER NOT NULL
+        )
+        """
+    )
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS leave_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            employee_id TEXT NOT NULL COLLATE NOCASE,
+            leave_date TEXT NOT NULL,
+            FOREIGN KEY (employee_id) REFERENCES employees (employee_id),
+            UNIQUE (employee_id, leave_date)
+        )
+        """
+    )
+    conn.close()
+
+
+def initialize_database_with_sample_data() -> None:
+    """Seed the two demo employees if the database is empty."""
+    conn = get_db_connection()
+    if conn.execute("SELECT COUNT(*) FROM employees").fetchone()[0] == 0:
+        # One parsed batch inside one transaction instead of two
+        # executemany preparations committing statement by statement.
+        conn.executescript(
+            """
+            BEGIN IMMEDIATE;
+            INSERT INTO employees (employee_id, balance) VALUES
+                ('E001', 18),
+                ('E002', 20);
+            INSERT INTO leave_history (employee_id, leave_date) VALUES
+                ('E001', '2024-12-25'),
+                ('E001', '2025-01-01');
+            COMMIT;
+            """
+        )
+    conn.close()
+
+
+async def get_balance(employee_id: str) -> Optional[int]:
+    """Return just the leave balance, skipping the history fetch for
+    callers that don't need it."""
+    pool = await _get_pool()
+    async with pool.acquire_reader() as conn:
+        async with conn.execute(
+            "SELECT balance FROM employees WHERE employee_id = ?", (employee_id,)
+        ) as cursor:
+            row = await cursor.fetchone()
+    return row[0] if row is not None else None
+
+
+async def get_employee_data(employee_id: str) -> Optional[dict]:
+    """Return {"balance": int, "history": [dates]} or None if unknown."""
+    pool = await _get_pool()
+    async with pool.acquire_reader() as conn:
+        async with conn.execute(
+            """
+            SELECT e.balance, lh.leave_date
+            FROM employees e
+            LEFT JOIN leave_history lh ON lh.employee_id = e.employee_id
+            WHERE e.employee_id = ?
+            ORDER BY lh.leave_date
+            """,
+            (employee_id,),
+        ) as cursor:
+            rows = await cursor.fetchall()
+    if not rows:
+        return None
+    history = [r[1] for r in rows if r[1] is not None]
+    return {"balance": rows[0][0], "history": history}
+
+
+# SQLite's default bound-parameter limit; two parameters per history row.
+_MAX_PARAMS = 999
+
+
+async def _insert_history(
+    conn: aiosqlite.Connection,
+    employee_id: str,
+    leave_dates: List[str],
+    or_ignore: bool = False,
+) -> int:
+    """Insert history rows as a single multi-row VALUES statement — one
+    prepare + one execute instead of the per-row stepping executemany
+    does — chunked to stay under the parameter limit. Returns the number
+    of rows actually inserted."""
+    verb = "INSERT OR IGNORE" if or_ignore else "INSERT"
+    chunk_size = _MAX_PARAMS // 2
+    inserted = 0
+    for start in range(0, len(leave_dates), chunk_size):
+        chunk = leave_dates[start : start + chunk_size]
+        placeholders = ", ".join(["(?, ?)"] * len(chunk))
+        params = [value for d in chunk for value in (employee_id, d)]
+        cursor = await conn.execute(
+            f"{verb} INTO leave_history (employee_id, leave_date) VALUES {placeholders}",
+            params,
+        )
+        inserted += cursor.rowcount
+    return inserted
+
+
+async def update_employee_leave(
+    employee_id: str, new_balance: int, leave_dates_to_add: List[str]
+) -> None:
+    pool = await _get_pool()
+    async with pool.write_txn() as conn:
+        await conn.execute(
+            "UPDATE employees SET balance = ? WHERE employee_id = ?",
+            (new_balance, employee_id),
+        )
+        await _insert_history(conn, employee_id, leave_dates_to_add)
+
+
+async def apply_leave_atomic(
+    employee_id: str, leave_dates: List[str]
+) -> Optional[Tuple[bool, int, int]]:
+    """Check balance and record leave in one BEGIN IMMEDIATE transaction.
+
+    Doing the read and the write under the same write lock closes the
+    window where two concurrent applications could both see the old
+    balance. Duplicate dates are absorbed by the UNIQUE constraint via
+    INSERT OR IGNORE rather than checked in Python.
+
+    Returns (success, balance, already_booked) where balance is the new
+    balance on success and the unchanged one on failure, or None if the
+    employee does not exist.
+    """
+    pool = await _get_pool()
+    async with pool.writer() as conn:
+        await conn.execute("BEGIN IMMEDIATE")
+        try:
+            async with conn.execute(
+                "SELECT balance FROM employees WHERE employee_id = ?", (employee_id,)
+            ) as cursor:
+                row = await cursor.fetchone()
+            if row is None:
+                await conn.execute("ROLLBACK")
+                return None
+            balance = row[0]
+            inserted = await _insert_history(conn, employee_id, leave_dates, or_ignore=True)
+            already_booked = len(leave_dates) - inserted
+            if inserted > balance:
+                await conn.execute("ROLLBACK")
+                return (False, balance, already_booked)
+            new_balance = balance - inserted
+            await conn.execute(
+                "UPDATE employees SET balance = ? WHERE employee_id = ?",
+                (new_balance, employee_id),
+            )
+            await conn.execute("COMMIT")
+            return (True, new_balance, already_booked)
+        except Exception:
+            await conn.execute("ROLLBACK")
+            raise
+
+
+_init_lock = threading.Lock()
+_initialized = False
+_pool: Optional[AsyncConnectionPool] = None
+_pool_lock: Optional[asyncio.Lock] = None
+
+
+def ensure_initialized() -> None:
+    """Create the schema and seed sample data once.
+
+    Importing this module does not touch the database; the server calls
+    this before serving. PRAGMA user_version marks a fully installed
+    schema, so a hot restart skips the CREATE/INSERT statements with a
+    single scalar read. The async connection pool itself is opened
+    lazily on the first tool call, inside the event loop.
+    """
+    global _initialized
+    if _initialized:
+        return
+    with _init_lock:
+        if _initialized:
+            return
+        conn = get_db_connection()
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        conn.close()
+        if version < SCHEMA_VERSION:
+            create_tables_if_not_exist()
+            initialize_database_with_sample_data()
+            conn = get_db_connection()
+            conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+            conn.close()
+        _initialized = True
+
+
+async def _get_pool() -> AsyncConnectionPool:
+    global _pool, _pool_lock
+    if _pool is not None:
+        return _pool
+    if _pool_lock is None:
+        _pool_lock = asyncio.Lock()
+    async with _pool_lock:
+        if _pool is None:
+            ensure_initialized()
+            pool = AsyncConnectionPool()
+            await pool.open()
+            _pool = pool
+    return _pool
+
+
+async def close_pool() -> None:
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
@@ -1,53 +1,70 @@
-from mcp.server.fastmcp import FastMCP
+import asyncio
+import datetime
+import re
 from typing import List
 
-# In-memory mock database with 20 leave days to start
-employee_leaves = {
-    "E001": {"balance": 18, "history": ["2024-12-25", "2025-01-01"]},
-    "E002": {"balance": 20, "history": []}
-}
+from mcp.server.fastmcp import FastMCP
+
+import database
+
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
 # Create MCP server
 mcp = FastMCP("LeaveManager")
 
 # Tool: Check Leave Balance
 @mcp.tool()
-def get_leave_balance(employee_id: str) -> str:
+async def get_leave_balance(employee_id: str) -> str:
     """Check how many leave days are left for the employee"""
-    data = employee_leaves.get(employee_id)
-    if data:
-        return f"{employee_id} has {data['balance']} leave days remaining."
+    employee_id = employee_id.strip()
+    balance = await database.get_balance(employee_id)
+    if balance is not None:
+        return f"{employee_id} has {balance} leave days remaining."
     return "Employee ID not found."
 
 # Tool: Apply for Leave with specific dates
 @mcp.tool()
-def apply_leave(employee_id: str, leave_dates: List[str]) -> str:
+async def apply_leave(employee_id: str, leave_dates: List[str]) -> str:
     """
     Apply leave for specific dates (e.g., ["2025-04-17", "2025-05-01"])
     """
-    if employee_id not in employee_leaves:
-        return "Employee ID not found."
+    employee_id = employee_id.strip()
+    for date_str in leave_dates:
+        if not _DATE_RE.match(date_str):
+            return f"Invalid date format: {date_str}. Use YYYY-MM-DD."
+        try:
+            # Format is already regex-checked, so skip strptime's format
+            # interpreter; the date constructor still rejects bogus
+            # calendar dates like 2023-02-30.
+            datetime.date(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
+        except ValueError:
+            return f"Invalid date: {date_str}."
 
-    requested_days = len(leave_dates)
-    available_balance = employee_leaves[employee_id]["balance"]
-
-    if available_balance < requested_days:
-        return f"Insufficient leave balance. You requested {requested_days} day(s) but have only {available_balance}."
+    result = await database.apply_leave_atomic(employee_id, leave_dates)
+    if result is None:
+        return "Employee ID not found."
 
-    # Deduct balance and add to history
-    employee_leaves[employee_id]["balance"] -= requested_days
-    employee_leaves[employee_id]["history"].extend(leave_dates)
+    success, balance, already_booked = result
+    requested_days = len(leave_dates) - already_booked
+    if not success:
+        return f"Insufficient leave balance. You requested {requested_days} day(s) but have only {balance}."
 
-    return f"Leave applied for {requested_days} day(s). Remaining balance: {employee_leaves[employee_id]['balance']}."
+    message = f"Leave applied for {requested_days} day(s). Remaining balance: {balance}."
+    if already_booked:
+        message += f" Skipped {already_booked} date(s) already booked."
+    return message
 
 
 # Resource: Leave history
 @mcp.tool()
-def get_leave_history(employee_id: str) -> str:
+async def get_leave_history(employee_id: str) -> str:
     """Get leave history for the employee"""
-    data = employee_leaves.get(employee_id)
+    employee_id = employee_id.strip()
+    data = await database.get_employee_data(employee_id)
     if data:
-        history = ', '.join(data['history']) if data['history'] else "No leaves taken."
+        history_list = data["history"]
+        # Already unique (schema constraint) and sorted (ORDER BY) from the DB.
+        history = ', '.join(history_list) if history_list else "No leaves taken."
         return f"Leave history for {employee_id}: {history}"
     return "Employee ID not found."
 
@@ -58,4 +75,10 @@ def get_greeting(name: str) -> str:
     return f"Hello, {name}! How can I assist you with leave management today?"
 
 if __name__ == "__main__":
-    mcp.run()
+    database.ensure_initialized()
+    try:
+        mcp.run()
+    finally:
+        # aiosqlite connection threads are non-daemon; close them so the
+        # process actually exits after a disconnect or Ctrl-C.
+        asyncio.run(database.close_pool())